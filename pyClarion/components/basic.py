@@ -66,12 +66,13 @@ class Receptors(cld.Process):
     def _fseq(
         self, data: Sequence[Union[str, Tuple[str, Union[str, int]]]]
     ) -> Generator[feature, None, None]:
+        reprs = frozenset(self.reprs)
         for x in data:
             if isinstance(x, tuple):
                 f = feature(cld.prefix(x[0], self.prefix), x[1]) 
             else:
                 f = feature(cld.prefix(x, self.prefix)) 
-            if f in self.reprs:
+            if f in reprs:
                 yield f
             else:
                 raise ValueError(f"Unexpected stimulus feature spec: '{x}'")
@@ -101,6 +102,7 @@ class Actions(cld.Process):
         actions: Union[Dict[str, List[str]], Dict[str, List[int]]]
     ) -> None:
         self.actions = OrderedDict(actions)
+        self._repr_cache: Dict[feature, feature] = {} # interned cmd -> repr map
 
     def call(self, c: nd.NumDict[feature]) -> nd.NumDict[feature]:
         return (c
@@ -112,21 +114,23 @@ class Actions(cld.Process):
         
         result = {}
         for d, vs in self.actions.items():
+            dim = cld.prefix(d, self.prefix)
             for v in vs:
-                s = a[feature(cld.prefix(d, self.prefix), v)]
-                if s == 1 and d not in result and v is not None:
-                    result[d] = v
-                elif s == 1 and d in result and v is not None:
-                    raise ValueError(f"Multiple values for action dim '{d}'")
-                else:
+                if v is None or a[feature(dim, v)] != 1:
                     continue
+                if d in result:
+                    raise ValueError(f"Multiple values for action dim '{d}'")
+                result[d] = v
         return result
 
     def _cmd2repr(self, cmd: feature):
-        _d, v, l = cmd
-        if l != 0: raise ValueError("Lagged cmd not allowed.")
-        d = re.sub(f"{cld.FSEP}{self._cmd_pre}-", f"{cld.FSEP}", _d)
-        return feature(d, v)
+        r = self._repr_cache.get(cmd)
+        if r is None:
+            _d, v, l = cmd
+            if l != 0: raise ValueError("Lagged cmd not allowed.")
+            d = re.sub(f"{cld.FSEP}{self._cmd_pre}-", f"{cld.FSEP}", _d)
+            r = self._repr_cache[cmd] = feature(d, v)
+        return r
 
     def _action_items(self):
         if len(self.actions) > 0:
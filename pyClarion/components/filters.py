@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Tuple, TypeVar, Sequence
+from typing import Tuple, TypeVar, Sequence, Dict
 
 from ..base import feature
 from .wm import Flags
@@ -75,6 +75,7 @@ class DimFilter(cld.Process):
 
     def __init__(self) -> None:
         self._flags = Flags(fs=(), vs=(0, 1))
+        self._flag_cache: Dict[feature, feature] = {}
 
     def call(
         self, c: nd.NumDict[feature], d: nd.NumDict[feature]
@@ -85,7 +86,12 @@ class DimFilter(cld.Process):
         return store, d.mul_from(store, kf=self._feature2flag)
 
     def _feature2flag(self, f):
-        return feature(cld.prefix(f.d.replace(cld.FSEP, "."), self.prefix))
+        # Memoized per input feature; invalidated when prefix changes
+        flag = self._flag_cache.get(f)
+        if flag is None:
+            flag = feature(cld.prefix(f.d.replace(cld.FSEP, "."), self.prefix))
+            self._flag_cache[f] = flag
+        return flag
 
     def update(self, c):
         self._flags.fs = tuple(f.d.replace(cld.FSEP, ".") 
@@ -103,6 +109,7 @@ class DimFilter(cld.Process):
     @prefix.setter
     def prefix(self, val: str) -> None:
         self._flags.prefix = val
+        self._flag_cache.clear()
 
     @property
     def fs(self) -> Tuple[str, ...]:
@@ -180,42 +180,24 @@ class Store(Process):
         return cb, rb
 
     def _extract_cp(self, p: nd.NumDict):
-        return (p
-            .keep(sf=self._select_cps)
-            .transform_keys(kf=self._transform_cps))
-
-    def _extract_rp(self, p: nd.NumDict):
-        return (p
-            .keep(sf=self._select_rps)
-            .transform_keys(kf=self._transform_rps))
-
-    def _select_cps(self, k):
-        if self.cb is not None:
-            return k in self.params[0:len(self.cb.params)]
-        else:
-            raise ValueError("Chunk BLAs not defined")
-
-    def _transform_cps(self, k):
         if self.cb is None:
             raise ValueError("Chunk BLAs not defined")
-        else:
-            params = self.params[0:len(self.cb.params)]
-            return self.cb.params[params.index(k)]
+        params = self.params[0:len(self.cb.params)]
+        return self._extract_bla_params(p, dict(zip(params, self.cb.params)))
 
-    def _select_rps(self, k):
+    def _extract_rp(self, p: nd.NumDict):
         if self.rb is None:
             raise ValueError("Rule BLAs not defined")
-        else:
-            offset = 0 if self.cb is None else len(self.cb.params)
-            return k in self.params[offset:offset + len(self.rb.params)]
+        offset = 0 if self.cb is None else len(self.cb.params)
+        params = self.params[offset:offset + len(self.rb.params)]
+        return self._extract_bla_params(p, dict(zip(params, self.rb.params)))
 
-    def _transform_rps(self, k):
-        if self.rb is None:
-            raise ValueError("Rule BLAs not defined")
-        else:
-            offset = 0 if self.cb is None else len(self.cb.params)
-            params = self.params[offset:offset + len(self.rb.params)]
-            return self.rb.params[params.index(k)]
+    @staticmethod
+    def _extract_bla_params(p: nd.NumDict, table: Dict[feature, str]):
+        # table maps store param features to BLA tracker param names
+        return (p
+            .keep(sf=table.__contains__)
+            .transform_keys(kf=table.__getitem__))
 
     @property
     def params(self):
@@ -261,14 +243,14 @@ class GoalStore(Store):
         cmds = self.cmds
         f = f.drop(sf=lambda ftr: ftr.v is None)
 
-        eval_ = f.keep(sf=cmds[-4:].__contains__)
+        eval_ = f.keep(sf=frozenset(cmds[-4:]).__contains__)
         if len(eval_):
             self.cf = self.cf.drop(sf=lambda k: k[0] in c)
             self.cw = self.cw.drop(sf=lambda k: k[0] in c)
             if self.cb is not None: self.cb.drop(c)
 
-        set_ = (f.keep(sf=cmds[:-4].__contains__)
-            .transform_keys(kf=self._cmd2repr))
+        set_ = (f.keep(sf=frozenset(cmds[:-4]).__contains__)
+            .transform_keys(kf=self._cmd2repr_map(cmds).__getitem__))
         if len(set_):
             new = chunk(uris.FSEP.join([self.prefix, str(next(self.count))])
                 .strip(uris.FSEP))
@@ -281,8 +263,10 @@ class GoalStore(Store):
         else:
             return super().call(p, nd.NumDict(), nd.NumDict(), nd.NumDict())
 
-    def _cmd2repr(self, cmd):
-        return self.reprs[self.cmds.index(cmd) - 1]
+    def _cmd2repr_map(self, cmds: Tuple[feature, ...]) -> Dict[feature, feature]:
+        # Set cmds carrying a value line up one-to-one with self.reprs
+        set_cmds = (cmd for cmd in cmds[:-4] if cmd.v is not None)
+        return dict(zip(set_cmds, self.reprs))
 
     def _goal_items(self):
         if len(self.gspec) > 0:
@@ -1,4 +1,4 @@
-from typing import Tuple, List, Sequence
+from typing import Tuple, List, Sequence, Dict, Set
 import re
 
 from ..base import feature, chunk
@@ -22,7 +22,9 @@ class Flags(cld.Process):
                 raise ValueError("Flag name starts with reserved prefix "
                     f"'{self.set_prefix}'")
 
-        self.fs = tuple(fs)
+        self._flag_cache: Dict[feature, feature] = {} # cmd: flag
+        self._prefix = ""
+        self._fs = tuple(fs)
         self.vs = (None, *vs) # type: ignore
         self.store = nd.NumDict(c=0)
 
@@ -31,30 +33,63 @@ class Flags(cld.Process):
         return self.store
 
     def update(self, c: nd.NumDict) -> None:
-        self.store = (self.store
-            .mul(c
-                .keep(sf=lambda f: f.v is None)
-                .transform_keys(kf=self.cmd2flag)
-                .mask())
-            .squeeze()
-            .merge(c
-                .keep(sf=lambda f: f.v == 1)
-                .transform_keys(kf=self.cmd2flag)
-                .mask())
-            .merge(c
-                .keep(sf=lambda f: f.v == -1)
-                .transform_keys(kf=self.cmd2flag)
-                .mask()
-                .mul(-1)))
+        # Single pass over c: nop cmds retain current flag values, +/-1 cmds 
+        # set flags, all other flags are cleared. A nop on a flag whose value 
+        # is 0 does not conflict with a set cmd for that flag.
+        store, cmd2flag = self.store, self.cmd2flag
+        m: Dict[feature, float] = {}
+        nops: Set[feature] = set()
+        for cmd in c:
+            v = cmd.v
+            if v is None:
+                flag = cmd2flag(cmd)
+                if flag in nops:
+                    raise ValueError(f"Multiple commands for flag '{flag}'")
+                nops.add(flag)
+                val = store[flag]
+                if val == 0.0:
+                    continue
+            elif v == 1 or v == -1:
+                flag, val = cmd2flag(cmd), float(v)
+            else:
+                continue
+            if flag in m:
+                raise ValueError(f"Multiple commands for flag '{flag}'")
+            m[flag] = val
+        self.store = nd.NumDict._new(m=m, c=0.0)
 
     def cmd2flag(self, f_cmd):
-        l, sep, r = f_cmd.d.partition(cld.FSEP)
-        d_cmd = l if not sep else r
-        flag = re.sub("^set-", "", d_cmd)
-        f = feature(cld.prefix(flag, self.prefix))
-        assert f in self.flags, f"regexp sub likely failed: '{f}'"
+        # Memoized per cmd; invalidated when prefix or fs changes
+        f = self._flag_cache.get(f_cmd)
+        if f is None:
+            l, sep, r = f_cmd.d.partition(cld.FSEP)
+            d_cmd = l if not sep else r
+            flag = re.sub("^set-", "", d_cmd)
+            f = feature(cld.prefix(flag, self.prefix))
+            assert f in self.flags, f"regexp sub likely failed: '{f}'"
+            self._flag_cache[f_cmd] = f
         return f
 
+    @property
+    def prefix(self) -> str:
+        return self._prefix
+
+    @prefix.setter
+    def prefix(self, val: str) -> None:
+        self._prefix = val
+        self._flag_cache.clear()
+
+    @property
+    def fs(self) -> Tuple[str, ...]:
+        return self._fs
+
+    @fs.setter
+    def fs(self, val: Sequence[str]) -> None:
+        fs = tuple(val)
+        if fs != self._fs:
+            self._fs = fs
+            self._flag_cache.clear()
+
     @property
     def flags(self) -> Tuple[feature, ...]:
         return tuple(feature(dim) for dim in cld.prefix(self.fs, self.prefix))
@@ -95,8 +130,9 @@ class Slots(cld.Process):
 
         self.update(c, s)
 
+        write_dims = set(self._write_dims())
         rd = (c # rd indicates for each slot if its contents should be read
-            .keep(sf=lambda k: k.d not in self._write_dims() and k.v == 1)
+            .keep(sf=lambda k: k.d not in write_dims and k.v == 1)
             .transform_keys(kf=self._cmd2slot))
         chunks = (self.store
             .put(rd, kf=cld.first)
@@ -122,12 +158,13 @@ class Slots(cld.Process):
         return chunks, flags
 
     def update(self, c: nd.NumDict, s: nd.NumDict) -> None:
+        write_dims, cmd2slot = set(self._write_dims()), self._cmd2slot
         ud = (c
-            .keep(sf=lambda k: k.d in self._write_dims() and k.v != 0)
-            .transform_keys(kf=self._cmd2slot))
+            .keep(sf=lambda k: k.d in write_dims and k.v != 0)
+            .transform_keys(kf=cmd2slot))
         wrt = (c
-            .keep(sf=lambda k: k.d in self._write_dims() and k.v == 1)
-            .transform_keys(kf=self._cmd2slot))
+            .keep(sf=lambda k: k.d in write_dims and k.v == 1)
+            .transform_keys(kf=cmd2slot))
         self.store = (wrt
             .outer(s)
             .merge(self.store
@@ -3,7 +3,7 @@ from __future__ import annotations
 from . import numdict as nd
 from . import gradient_tape as gt
 
-from typing import Any, Tuple, Callable, TypeVar, Iterable, overload
+from typing import Any, Tuple, Callable, TypeVar, Iterable, Dict, overload
 
 
 __all__ = ["mask", "isolate", "keep", "drop", "with_keys", "transform_keys", 
@@ -154,7 +154,7 @@ def transform_keys(
     :param d: The NumDict to be transformed.
     :param kf: A function taking keys of d to a new keys space.
     """
-    new = nd.NumDict._new(m={kf(k): d[k] for k in d}, c=d._c)
+    new = nd.NumDict._new(m={kf(k): v for k, v in d.items()}, c=d._c)
     if len(d) != len(new):
         raise ValueError("Function must be one-to-one on keys of arg d.")
     return new
@@ -171,10 +171,13 @@ def _grad_transform_keys(
 def merge(*ds: nd.NumDict[T]) -> nd.NumDict[T]:
     if len(ds) == 0:
         raise ValueError("Merge must be provided with at least one argument.")
-    d = nd.NumDict[T]._new(c=0.0)
+    m: Dict[T, float] = {}
     for _d in ds: 
-        d.update({k: v for k, v in _d.items()}, strict=True)
-    return d
+        n_old = len(m)
+        m.update(_d._m)
+        if len(m) < n_old + len(_d):
+            raise ValueError("Arg m not disjoint with self")
+    return nd.NumDict._new(m=m, c=0.0)
 
 @gt.GradientTape.grad(merge)
 def _grad_merge(
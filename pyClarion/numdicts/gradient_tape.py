@@ -132,20 +132,25 @@ class GradientTape:
         """
 
         if self._rec: raise TapeError("Stop recording before backward pass.")
-        delta = {seed: nd.NumDict(c=seed_c)}
-        for i, cell in reversed(list(enumerate(self._cells))):
-            delta.setdefault(i, nd.NumDict(c=0.0))
+        delta = {seed: nd.NumDict._new(c=float(seed_c))}
+        # Shared read-only zero for cells w/o incoming gradients; accumulation 
+        # below always rebinds, so it is never mutated or handed out.
+        zero = nd.NumDict._new(c=0.0, prot=True)
+        for i in reversed(range(len(self._cells))):
+            cell = self._cells[i]
             if cell.op:
                 grad_op = self.GRADS[cell.op]
                 if grad_op is None or id(cell.value) in self._block:
                     pass
                 else:
                     inputs = (self._cells[k].value for k in cell.operands)
-                    grads = grad_op(delta[i], cell.value, *inputs, **cell.kwds)
+                    grads = grad_op(delta.get(i, zero), cell.value, *inputs, 
+                        **cell.kwds)
                     for j, k in enumerate(cell.operands):
                         if k in indices or self._cells[k].op != "":
-                            delta.setdefault(k, nd.NumDict(c=0.0))
-                            delta[k] += grads[j]
+                            delta[k] = delta.get(k, zero) + grads[j]
+        for k in indices:
+            delta.setdefault(k, nd.NumDict._new(c=0.0))
         return delta
 
     def reset(self) -> None:
@@ -264,11 +269,8 @@ class GradientTape:
             @wraps(f)
             def op_wrapper(*args: P.args, **kwargs: P.kwargs) -> nd.NumDict:
                 d = f(*args, **kwargs)
-                try: 
-                    tape = cls.TAPE.get()
-                except LookupError: 
-                    pass
-                else: 
+                tape = cls.TAPE.get(None) # fast path when no tape is active
+                if tape is not None and tape._rec: 
                     tape._register(d, name, args, kwargs)
                 return d
 
@@ -8,7 +8,8 @@ from . import dict_ops as dops
 from . import vec_ops as vops
 from . import nn_ops
 
-from typing import Callable, Dict, Mapping, TypeVar, Iterator, Any, Optional
+from typing import (Callable, Dict, Mapping, TypeVar, Iterator, Any, Optional, 
+    KeysView, ValuesView, ItemsView)
 from typing_extensions import Concatenate, ParamSpec
 from functools import wraps
 from math import isnan, isinf
@@ -32,6 +33,20 @@ def inplace(
     return wrapper
 
 
+def binary_dunder(
+    f: Callable[["NumDict[T]", Any], R]
+) -> Callable[["NumDict[T]", Any], R]:
+
+    # Defer to the other operand's reflected method on foreign operands
+    @wraps(f)
+    def wrapper(d1: "NumDict[T]", d2: Any) -> R:
+        if not isinstance(d2, (NumDict, float, int, bool)):
+            return NotImplemented
+        return f(d1, d2)
+
+    return wrapper
+
+
 class NumDict(Mapping[T, float]):
     """
     A numerical dictionary.
@@ -102,31 +117,39 @@ class NumDict(Mapping[T, float]):
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, NumDict):
-            return self._m == other._m and self.c == other.c
+            return self._c == other._c and self._m == other._m
         else:
             return NotImplemented
 
     def __repr__(self) -> str:
-        m = f"{repr(self._m)}" if self._m else ""
-        c = f"c={self.c}"
-        prot = f"prot={self.prot}" if self.prot else ""
-        args = ", ".join(arg for arg in (m, c, prot) if arg)
-        return f"{type(self).__name__}({args})"
+        m = f"{self._m!r}, " if self._m else ""
+        prot = ", prot=True" if self._prot else ""
+        return f"{type(self).__name__}({m}c={self._c}{prot})"
 
     def __len__(self) -> int:
         return len(self._m)
 
     def __iter__(self) -> Iterator[T]:
-        yield from iter(self._m)
+        return iter(self._m)
 
     def __contains__(self, key: Any) -> bool:
         return key in self._m
 
+    # Delegate views to the underlying dict; the Mapping mixins would
+    # otherwise route every item access through self.__getitem__.
+
+    def keys(self) -> KeysView[T]:
+        return self._m.keys()
+
+    def values(self) -> ValuesView[float]:
+        return self._m.values()
+
+    def items(self) -> ItemsView[T, float]:
+        return self._m.items()
+
     def __getitem__(self, key: Any) -> float:
-        try:
-            return self._m[key] # type: ignore
-        except KeyError:
-            return self._c
+        # Misses fall back to the constant without raising or writing back
+        return self._m.get(key, self._c)
 
     @inplace
     def __setitem__(self, key: Any, val: float | int | bool) -> None:
@@ -139,7 +162,7 @@ class NumDict(Mapping[T, float]):
     @inplace
     def clear(self) -> None:
         """Clear all key-value associations in self."""
-        self._m = {}
+        self._m.clear() # in place, so views from keys/values/items stay live
 
     @inplace
     def update(
@@ -163,15 +186,15 @@ class NumDict(Mapping[T, float]):
 
     def has_inf(self) -> bool:
         """Return True iff any key is mapped to inf or the constant is inf."""
-        return any(map(isinf, self.values())) or isinf(self.c)
+        return isinf(self._c) or any(map(isinf, self._m.values()))
 
     def has_nan(self) -> bool:
         """Return True iff any key is mapped to nan or the constant is nan."""
-        return any(map(isnan, self.values())) or isnan(self.c)
+        return isnan(self._c) or any(map(isnan, self._m.values()))
     
     def copy(self: "NumDict[T]") -> "NumDict[T]":
         """Return an unprotected copy of self."""
-        return type(self)(m=self, c=self.c)
+        return type(self)._new(m=self._m.copy(), c=self._c)
 
     def pipe(
         self, 
@@ -187,29 +210,29 @@ class NumDict(Mapping[T, float]):
     __neg__ = bops.neg
     __abs__ = bops.absolute
     
-    __lt__ = bops.less
-    __gt__ = bops.greater
-    __leq__ = bops.less_equal
-    __geq__ = bops.greater_equal
-
-    __add__ = bops.add
-    __radd__ = bops.add
-    __mul__ = bops.mul
-    __rmul__ = bops.mul
-    __sub__ = bops.sub
-    __rsub__ = bops.rsub
-    __truediv__ = bops.div
-    __rtruediv__ = bops.rdiv
-    __pow__ = bops.power
-    __rpow__ = bops.rpow
-
-    __or__ = bops.maximum
-    __ror__ = bops.maximum
-    __and__ = bops.minimum
-    __rand__ = bops.minimum
-
-    __matmul__ = vops.matmul
-    __rmatmul__ = vops.matmul
+    __lt__ = binary_dunder(bops.less)
+    __gt__ = binary_dunder(bops.greater)
+    __le__ = binary_dunder(bops.less_equal)
+    __ge__ = binary_dunder(bops.greater_equal)
+
+    __add__ = binary_dunder(bops.add)
+    __radd__ = binary_dunder(bops.add)
+    __mul__ = binary_dunder(bops.mul)
+    __rmul__ = binary_dunder(bops.mul)
+    __sub__ = binary_dunder(bops.sub)
+    __rsub__ = binary_dunder(bops.rsub)
+    __truediv__ = binary_dunder(bops.div)
+    __rtruediv__ = binary_dunder(bops.rdiv)
+    __pow__ = binary_dunder(bops.power)
+    __rpow__ = binary_dunder(bops.rpow)
+
+    __or__ = binary_dunder(bops.maximum)
+    __ror__ = binary_dunder(bops.maximum)
+    __and__ = binary_dunder(bops.minimum)
+    __rand__ = binary_dunder(bops.minimum)
+
+    __matmul__ = binary_dunder(vops.matmul)
+    __rmatmul__ = binary_dunder(vops.matmul)
 
     ### Mathematical Methods ###
 
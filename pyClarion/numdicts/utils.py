@@ -4,6 +4,7 @@ from . import numdict as nd
 
 from typing import (Callable, Union, Iterable, TypeVar, Any, Set, Dict, List,   
     overload, Optional)
+from itertools import chain, repeat
 from math import copysign, exp
 from math import isclose as _isclose
 from math import isinf as _isinf
@@ -19,7 +20,11 @@ def coerce2(
 ) -> Callable[[nd.NumDict[T], NDLike[T]], nd.NumDict[T]]:
 
     def wrapper(d1: nd.NumDict[T], d2: NDLike[T]) -> nd.NumDict[T]:
-        d2 = nd.NumDict[T](c=d2) if isinstance(d2, (float, int, bool)) else d2
+        if isinstance(d2, (float, int, bool)):
+            d2 = nd.NumDict._new(c=float(d2))
+        elif not isinstance(d2, nd.NumDict):
+            raise TypeError(
+                f"Unsupported operand type: '{type(d2).__name__}'")
         return f(d1, d2)
 
     wrapper.__name__ = f.__name__
@@ -28,17 +33,22 @@ def coerce2(
     return wrapper
 
 
+# op1 & op2 evaluate f over key-aligned value sequences w/ map & zip, keeping 
+# the elementwise loop out of Python bytecode.
+
+
 def op1(f: Callable[[float], float], d: nd.NumDict[T]) -> nd.NumDict[T]:
-    return nd.NumDict._new(m={k: f(v) for k, v in d.items()}, c=f(d.c))
+    m = d._m
+    return nd.NumDict._new(m=dict(zip(m, map(f, m.values()))), c=f(d._c))
 
 
 def op2(
     f: Callable[[float, float], float], d1: nd.NumDict[T], d2: nd.NumDict[T]
 ) -> nd.NumDict[T]:
-    keys = set(d1) | set(d2)
-    return nd.NumDict._new(
-        m={k: f(d1[k], d2[k]) for k in keys}, 
-        c=f(d1.c, d2.c))
+    m1, m2, c1, c2 = d1._m, d2._m, d1._c, d2._c
+    keys = m1.keys() | m2.keys()
+    vals = map(f, map(m1.get, keys, repeat(c1)), map(m2.get, keys, repeat(c2)))
+    return nd.NumDict._new(m=dict(zip(keys, vals)), c=f(c1, c2))
 
 
 ### ABSTRACT AGGREGATION FUNCTIONS ###
@@ -51,12 +61,11 @@ def reduce(
     initial: float, 
     key: Optional[T] = None
 ) -> nd.NumDict[T]:
-    values = [initial]; values.extend(d.values())
-    result = f(values)
+    result = f(chain((initial,), d._m.values()))
     if key is None: 
-        return nd.NumDict[T]._new(m={}, c=result)
+        return nd.NumDict._new(m={}, c=result)
     else: 
-        return nd.NumDict[T]._new(m={key: result})
+        return nd.NumDict._new(m={key: result})
 
 
 def by(
@@ -129,7 +129,8 @@ def put(
         {k: source[kf(k)] for k in d}
     """
     return nd.NumDict._new(
-        m={k: source[kf(k)] for k in d if not strict or kf(k) in source})
+        m={k: source[j] for k, j in zip(d, map(kf, d)) 
+        if not strict or j in source})
 
 @gt.GradientTape.grad(put)
 def _grad_put(
@@ -157,8 +158,8 @@ def mul_from(
         {k: v * source[kf(k)] for k, v in d.items()}
     """
     return nd.NumDict._new(
-        m={k: v * source[kf(k)] for k, v in d.items() 
-        if not strict or kf(k) in source})
+        m={k: v * source[j] for (k, v), j in zip(d.items(), map(kf, d)) 
+        if not strict or j in source})
 
 @gt.GradientTape.grad(mul_from)
 def _grad_mul_from(
@@ -185,8 +186,8 @@ def div_from(
         {k: v * source[kf(k)] for k, v in d.items()}
     """
     return nd.NumDict._new(
-        m={k: v / source[kf(k)] for k, v in d.items() 
-        if not strict or kf(k) in source})
+        m={k: v / source[j] for (k, v), j in zip(d.items(), map(kf, d)) 
+        if not strict or j in source})
 
 @gt.GradientTape.grad(div_from)
 def _grad_div_from(